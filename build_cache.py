@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+Precompute the packed word count matrices used by diffle-solver.py.
+
+Run this once after updating allowed.csv or answers.csv:
+
+    python3 build_cache.py
+
+It writes allowed.npy and answers.npy, which the solver memory-maps at
+startup instead of rebuilding the matrices from ~280k Word objects.
+"""
+import importlib.util
+import os
+
+import numpy as np
+
+# diffle-solver.py has a hyphen in its name, so load it by path.
+_spec = importlib.util.spec_from_file_location(
+    "diffle_solver", os.path.join(os.path.dirname(__file__), "diffle-solver.py"))
+solver = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(solver)
+
+if __name__ == "__main__":
+    for cache_file, words in (("allowed.npy", solver.load_allowed_words()),
+                              ("answers.npy", solver.load_answer_words())):
+        arrays = solver.build_word_arrays(solver.init_words(words))
+        np.save(cache_file, solver.pack_word_arrays(arrays))
+        print(f"{cache_file}: cached matrices for {len(words)} words")
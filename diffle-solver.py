@@ -22,10 +22,24 @@ The algorithm works by simulating what feedback each potential guess would produ
 #!/usr/bin/env python3
 import csv
 import collections
+import functools
+import os
 import re
+import string
 from abc import ABC, abstractmethod
 from concurrent.futures import ProcessPoolExecutor
-from bs4 import BeautifulSoup
+from multiprocessing import shared_memory
+import numpy as np
+
+# Numba is optional: when available, scoring runs as a JIT-compiled parallel
+# kernel; otherwise we fall back to the multiprocessing scorer.
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Map each lowercase letter to a fixed column index in the count matrices.
+LETTER_IDX = {c: i for i, c in enumerate(string.ascii_lowercase)}
 
 # -------------------------
 # Data Model and Rule Classes
@@ -33,16 +47,13 @@ from bs4 import BeautifulSoup
 class Word:
     def __init__(self, word: str):
         self.word = word
-        # Use collections.Counter for efficient letter counting
-        self.letter_count = collections.Counter(word)
-        self.guess_rules = []
-        # Create rules based on letter occurrences, tracking the count as we progress in the word
-        occurrences = {}
+        # Letter counts as a 26-byte string indexed by LETTER_IDX: an order
+        # of magnitude smaller than a Counter, with faster lookups, and
+        # buffer-compatible with the uint8 count matrices.
+        counts = bytearray(26)
         for letter in word:
-            occurrences[letter] = occurrences.get(letter, 0) + 1
-            self.guess_rules.append(LetterOccurrenceRule(letter, occurrences[letter], exact=False))
-        self.guess_rules.append(LetterStartRule(word[0]))
-        self.guess_rules.append(LetterEndRule(word[-1]))
+            counts[LETTER_IDX[letter]] += 1
+        self.counts = bytes(counts)
 
     def __repr__(self):
         return self.word
@@ -52,36 +63,64 @@ class Rule(ABC):
     def matches(self, word: Word) -> bool:
         pass
 
+    @abstractmethod
+    def as_mask(self, counts: np.ndarray, first: np.ndarray, last: np.ndarray,
+                words: list) -> np.ndarray:
+        """
+        Vectorized matches: return a boolean mask over a set of words given
+        by their numpy representation (see build_word_arrays) plus the Word
+        list itself for rules that need the raw strings.
+        """
+        pass
+
 class LetterOccurrenceRule(Rule):
     def __init__(self, letter: str, num_occurrences: int, exact: bool):
         self.letter = letter
+        self.letter_idx = LETTER_IDX[letter]
         self.num_occurrences = num_occurrences
         self.exact = exact
 
     def matches(self, word: Word) -> bool:
-        actual_occurrences = word.letter_count.get(self.letter, 0)
+        actual_occurrences = word.counts[self.letter_idx]
         return (actual_occurrences == self.num_occurrences) if self.exact else (actual_occurrences >= self.num_occurrences)
 
+    def as_mask(self, counts: np.ndarray, first: np.ndarray, last: np.ndarray,
+                words: list) -> np.ndarray:
+        actual_occurrences = counts[:, self.letter_idx]
+        if self.exact:
+            return actual_occurrences == self.num_occurrences
+        return actual_occurrences >= self.num_occurrences
+
     def __repr__(self):
         return f"LetterOccurrenceRule({self.letter}, {self.num_occurrences}, exact={self.exact})"
 
 class LetterStartRule(Rule):
     def __init__(self, letter: str):
         self.letter = letter
+        self.letter_idx = LETTER_IDX[letter]
 
     def matches(self, word: Word) -> bool:
         return word.word.startswith(self.letter)
 
+    def as_mask(self, counts: np.ndarray, first: np.ndarray, last: np.ndarray,
+                words: list) -> np.ndarray:
+        return first == self.letter_idx
+
     def __repr__(self):
         return f"LetterStartRule({self.letter})"
 
 class LetterEndRule(Rule):
     def __init__(self, letter: str):
         self.letter = letter
+        self.letter_idx = LETTER_IDX[letter]
 
     def matches(self, word: Word) -> bool:
         return word.word.endswith(self.letter)
 
+    def as_mask(self, counts: np.ndarray, first: np.ndarray, last: np.ndarray,
+                words: list) -> np.ndarray:
+        return last == self.letter_idx
+
     def __repr__(self):
         return f"LetterEndRule({self.letter})"
 
@@ -92,6 +131,12 @@ class RegexRule(Rule):
     def matches(self, word: Word) -> bool:
         return bool(self.regex.fullmatch(word.word))
 
+    def as_mask(self, counts: np.ndarray, first: np.ndarray, last: np.ndarray,
+                words: list) -> np.ndarray:
+        fullmatch = self.regex.fullmatch
+        return np.fromiter((fullmatch(word.word) is not None for word in words),
+                           dtype=bool, count=len(words))
+
     def __repr__(self):
         return f"RegexRule({self.regex})"
 
@@ -110,82 +155,376 @@ def clean_words(words: list) -> list:
     # Diffle only allows words of up to 10 letters.
     return [word for word in words if len(word) <= 10]
 
+def load_allowed_words() -> list:
+    """Load and clean the allowed guess words, shortest first."""
+    words = clean_words(load_words('allowed.csv'))
+    # Shortest words first: short guesses win score ties, so once one sets
+    # the best score, equal-scoring longer guesses prune almost immediately.
+    words.sort(key=len)
+    return words
+
+def load_answer_words() -> list:
+    """Load the candidate answer words (guaranteed valid, no cleaning needed)."""
+    return load_words('answers.csv')
+
 def init_words(words: list) -> list:
     """Convert a list of strings into a list of Word objects."""
     return [Word(word) for word in words]
 
+def build_word_arrays(words: list) -> tuple:
+    """
+    Build the numpy representation of a list of Word objects.
+
+    Return a tuple of (counts, first, last, lens) where counts is an (N, 26)
+    uint8 matrix of per-letter occurrence counts, first/last are length-N
+    uint8 arrays holding the letter index of each word's first/last letter,
+    and lens is a length-N uint8 array of word lengths.
+    """
+    n = len(words)
+    # Word.counts are already uint8-compatible bytes, so the count matrix is
+    # a zero-copy view over their concatenation.
+    counts = np.frombuffer(b''.join(word.counts for word in words),
+                           dtype=np.uint8).reshape(n, 26)
+    first = np.zeros(n, dtype=np.uint8)
+    last = np.zeros(n, dtype=np.uint8)
+    lens = np.zeros(n, dtype=np.uint8)
+    for i, word in enumerate(words):
+        first[i] = LETTER_IDX[word.word[0]]
+        last[i] = LETTER_IDX[word.word[-1]]
+        lens[i] = len(word.word)
+    return counts, first, last, lens
+
+def pack_word_arrays(arrays: tuple) -> np.ndarray:
+    """Pack a build_word_arrays tuple into one (N, 29) uint8 array."""
+    counts, first, last, lens = arrays
+    return np.hstack((counts, first[:, None], last[:, None], lens[:, None]))
+
+def _cache_matches(packed: np.ndarray, words: list) -> bool:
+    """
+    Verify a packed cache against the in-memory word list.
+
+    Shape alone cannot catch a word list that was edited without changing
+    its word count, so also compare the full count matrix against the
+    concatenated Word.counts (cheap, one buffer compare) and spot-check the
+    first/last/length columns of evenly spaced rows (anagram swaps keep the
+    counts but can change those).
+    """
+    if packed.shape != (len(words), 29):
+        return False
+    if not words:
+        return True
+    if packed[:, :26].tobytes() != b''.join(word.counts for word in words):
+        return False
+    sample = list(range(0, len(words), max(1, len(words) // 32))) + [len(words) - 1]
+    for i in sample:
+        word = words[i]
+        if (packed[i, 26] != LETTER_IDX[word.word[0]]
+                or packed[i, 27] != LETTER_IDX[word.word[-1]]
+                or packed[i, 28] != len(word.word)):
+            return False
+    return True
+
+def load_word_arrays(cache_file: str, words: list) -> tuple:
+    """
+    Return the numpy representation of the given Word objects, preferring
+    the packed on-disk cache produced by build_cache.py.
+
+    The cache is memory-mapped, so startup does no per-word Python work and
+    pages are shared with the OS page cache. Falls back to
+    build_word_arrays when the cache is missing or stale (see
+    _cache_matches).
+    """
+    try:
+        packed = np.load(cache_file, mmap_mode='r')
+    except OSError:
+        return build_word_arrays(words)
+    if not _cache_matches(packed, words):
+        print(f"[debug] stale cache {cache_file}, rebuilding in memory")
+        return build_word_arrays(words)
+    return packed[:, :26], packed[:, 26], packed[:, 27], packed[:, 28]
+
 # -------------------------
 # Game Scoring and Rule Application
 # -------------------------
-def split_by_rule(word_lists: list, rule: Rule) -> list:
+class RuleMaskCache:
     """
-    Split each word list into two lists, one where all words matches the given
-    rule, and one where they don't.
+    Lazily memoize rule-match masks against a fixed set of remaining words.
 
-    Return an updated list of word lists with empty word lists removed.
+    Identical rules recur across thousands of guesses scored against the same
+    remaining words (most guesses share common letters), so each distinct
+    occurrence/start/end rule's boolean mask is computed once and then looked
+    up instead of re-scanning the count matrix.
     """
-    result = []
-    for word_list in word_lists:
-        true_group = []
-        false_group = []
-        for word in word_list:
-            match = rule.matches(word)
-            if match:
-                true_group.append(word)
-            else:
-                false_group.append(word)
-        if false_group:
-            result.append(false_group)
-        if true_group:
-            result.append(true_group)
-    return result
-
-def get_max_remaining_after_guessing(guess_word: Word, remaining_words: list) -> int:
+    def __init__(self, rem_counts: np.ndarray, rem_first: np.ndarray, rem_last: np.ndarray):
+        self.rem_counts = rem_counts
+        self.rem_first = rem_first
+        self.rem_last = rem_last
+        self._occurrence_masks = {}
+        self._start_masks = {}
+        self._end_masks = {}
+
+    def occurrence_mask(self, letter_idx: int, num_occurrences: int) -> np.ndarray:
+        key = (letter_idx, num_occurrences)
+        mask = self._occurrence_masks.get(key)
+        if mask is None:
+            mask = self.rem_counts[:, letter_idx] >= num_occurrences
+            self._occurrence_masks[key] = mask
+        return mask
+
+    def start_mask(self, letter_idx: int) -> np.ndarray:
+        mask = self._start_masks.get(letter_idx)
+        if mask is None:
+            mask = self.rem_first == letter_idx
+            self._start_masks[letter_idx] = mask
+        return mask
+
+    def end_mask(self, letter_idx: int) -> np.ndarray:
+        mask = self._end_masks.get(letter_idx)
+        if mask is None:
+            mask = self.rem_last == letter_idx
+            self._end_masks[letter_idx] = mask
+        return mask
+
+def get_max_remaining_after_guessing(guess_counts_row: np.ndarray, guess_first_idx: int,
+                                     guess_last_idx: int, masks: RuleMaskCache,
+                                     alpha: int = None) -> int:
     """
     For a given guess word, return the maximum number of possible remaining
     words after making the guess.
-    """
-    word_lists = [remaining_words]
-    for rule in guess_word.guess_rules:
-        word_lists = split_by_rule(word_lists, rule)
-    return max(len(group) for group in word_lists)
 
-def compute_score(guess_word: Word, remaining_words: list) -> tuple:
+    The guess is given as its count matrix row plus first/last letter
+    indices; a guess with k occurrences of a letter implies the rules
+    "at least 1" through "at least k" of that letter. The remaining words are
+    given as a RuleMaskCache over their numpy representation (see
+    build_word_arrays), so each rule is a single cached mask lookup instead
+    of a per-word Python loop.
+
+    Partitioning happens in place: every word starts in group 0 and each
+    rule shifts its match bit into a per-word group id (at most
+    len(word) + 2 bits), so no intermediate group lists are allocated. The
+    answer is the size of the largest group, via np.bincount.
+
+    When alpha is given, scoring is abandoned as soon as the guess provably
+    cannot beat a best-so-far of alpha: the rules not yet applied can split
+    any group at most `capacity` ways, so ceil(current max group / capacity)
+    lower-bounds the final score. The returned value is then only that lower
+    bound, but still larger than alpha.
+    """
+    group_ids = np.zeros(masks.rem_counts.shape[0], dtype=np.int32)
+    if alpha is None:
+        alpha = group_ids.size  # max group size can never exceed this
+    letter_idxs = np.nonzero(guess_counts_row)[0]
+    # Maximum splitting factor of the rules not applied yet: each letter's
+    # occurrence rules contribute (count + 1) outcomes, start/end 4.
+    capacity = 4
+    for letter_idx in letter_idxs:
+        capacity *= int(guess_counts_row[letter_idx]) + 1
+    current_max = group_ids.size
+    for letter_idx in letter_idxs:
+        lower_bound = -(-current_max // capacity)
+        if lower_bound > alpha:
+            return lower_bound
+        for k in range(1, guess_counts_row[letter_idx] + 1):
+            group_ids <<= 1
+            group_ids |= masks.occurrence_mask(int(letter_idx), k)
+        capacity //= int(guess_counts_row[letter_idx]) + 1
+        current_max = int(np.bincount(group_ids).max())
+    group_ids <<= 1
+    group_ids |= masks.start_mask(guess_first_idx)
+    group_ids <<= 1
+    group_ids |= masks.end_mask(guess_last_idx)
+    return int(np.bincount(group_ids).max())
+
+def _share_arrays(arrays: tuple) -> tuple:
     """
-    Return the score of the guess word, where lower lexicographical scores are
-    better.
+    Copy the given numpy arrays into a single new SharedMemory block.
 
-    The score prioritizes words that reduce the max possible remaining words
-    after making the guess, and then by the guess word length.
+    Return a tuple of (shm, meta) where meta describes each array's shape,
+    dtype and byte offset so workers can reconstruct views via
+    _attach_arrays. The caller owns the block and must close/unlink it.
     """
-    return (get_max_remaining_after_guessing(guess_word, remaining_words), len(guess_word.word))
+    shm = shared_memory.SharedMemory(create=True, size=sum(a.nbytes for a in arrays))
+    meta = []
+    offset = 0
+    for array in arrays:
+        view = np.ndarray(array.shape, array.dtype, buffer=shm.buf, offset=offset)
+        view[:] = array
+        meta.append((array.shape, array.dtype.str, offset))
+        offset += array.nbytes
+    return shm, meta
+
+def _attach_arrays(shm: shared_memory.SharedMemory, meta: list) -> list:
+    """Reconstruct zero-copy array views over a SharedMemory block."""
+    return [np.ndarray(shape, np.dtype(dtype_str), buffer=shm.buf, offset=offset)
+            for shape, dtype_str, offset in meta]
+
+# Per-process state for pool workers, set up by _init_worker.
+_WORKER_STATE = {}
+
+def _init_worker(rem_shm_name: str, rem_meta: list, guess_shm_name: str, guess_meta: list):
+    """
+    Attach this worker process to the shared-memory matrices of the current
+    scoring call.
 
-def compute_scores_batch(args: tuple[list, list]) -> list:
+    Called at the top of every worker task; the check on the shm names
+    makes repeat calls for the same matrices a no-op, and a later call
+    publishing new matrices triggers a re-attach. Old attachments are
+    dropped and closed by garbage collection.
+    """
+    if _WORKER_STATE.get("shm_names") == (rem_shm_name, guess_shm_name):
+        return
+    rem_shm = shared_memory.SharedMemory(name=rem_shm_name)
+    guess_shm = shared_memory.SharedMemory(name=guess_shm_name)
+    rem_counts, rem_first, rem_last = _attach_arrays(rem_shm, rem_meta)
+    guess_counts, guess_first, guess_last, guess_lens = _attach_arrays(guess_shm, guess_meta)
+    _WORKER_STATE.clear()
+    # Keep the shm objects referenced so the buffers stay mapped.
+    _WORKER_STATE.update(
+        shm_names=(rem_shm_name, guess_shm_name),
+        rem_shm=rem_shm,
+        guess_shm=guess_shm,
+        masks=RuleMaskCache(rem_counts, rem_first, rem_last),
+        guess_counts=guess_counts,
+        guess_first=guess_first,
+        guess_last=guess_last,
+        guess_lens=guess_lens,
+        # Worker-local branch-and-bound bound: the best (max group, length)
+        # score this worker has fully scored against the current matrices.
+        alpha=rem_counts.shape[0],
+        alpha_len=16,  # longer than any allowed word
+    )
+
+# Guesses scored per fallback worker task.
+SCORE_BATCH_SIZE = 1000
+
+def compute_scores_batch(attach_args: tuple, start: int) -> tuple:
     """
-    Worker function for scoring a batch of guess words.
+    Worker function: score a batch of guess words starting at the given
+    index into the shared guess matrices.
 
-    Parameters:
-    args -- a tuple with a list of guess words and list of remaining words.
+    attach_args is the shared-memory attachment info forwarded to
+    _init_worker, which is a no-op when the worker is already attached.
 
-    Return a list of tuples (Word, compute_score(Word)).
+    Return (start, scores) where scores is an int32 array of max_remaining
+    values for the batch, to be scattered into the driver's preallocated
+    score array.
     """
-    words_batch, remaining_words = args
-    results = []
-    for word in words_batch:
-        score = compute_score(word, remaining_words)
-        # print(f"[debug] finished compute_score: {word}, {score}")
-        results.append((word, score))
-    return results
-
-def get_next_guess(all_words: list, remaining_words: list) -> tuple[Word, tuple[int, int]]:
+    _init_worker(*attach_args)
+    masks = _WORKER_STATE["masks"]
+    guess_counts = _WORKER_STATE["guess_counts"]
+    guess_first = _WORKER_STATE["guess_first"]
+    guess_last = _WORKER_STATE["guess_last"]
+    end = min(start + SCORE_BATCH_SIZE, guess_counts.shape[0])
+    scores = np.empty(end - start, dtype=np.int32)
+    guess_lens = _WORKER_STATE["guess_lens"]
+    for g in range(start, end):
+        # A guess longer than the current best has already lost the length
+        # tie-break, so it must beat alpha strictly: prune one step earlier.
+        alpha = _WORKER_STATE["alpha"]
+        guess_len = int(guess_lens[g])
+        if guess_len > _WORKER_STATE["alpha_len"]:
+            alpha -= 1
+        max_remaining = get_max_remaining_after_guessing(
+            guess_counts[g], int(guess_first[g]), int(guess_last[g]), masks,
+            alpha=alpha)
+        if (max_remaining, guess_len) < (_WORKER_STATE["alpha"], _WORKER_STATE["alpha_len"]):
+            _WORKER_STATE["alpha"] = max_remaining
+            _WORKER_STATE["alpha_len"] = guess_len
+        scores[g - start] = max_remaining
+    return (start, scores)
+
+# Persistent scoring pool, created on first use and reused across turns so
+# workers are not re-forked and re-imported on every get_next_guess call.
+_pool = None
+
+def _get_pool() -> ProcessPoolExecutor:
     """
-    Select the next guess word from either all_words or remaining_words.
+    Return the persistent scoring pool, creating it on first use.
+
+    No initializer: workers attach to the current call's shared memory at
+    the top of every task instead, so a worker spawned after an earlier
+    call's blocks were unlinked (the spawn start method launches workers on
+    demand) never runs against a dead shm name.
+    """
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _pool
+
+if numba is not None:
+    @numba.njit(parallel=True, cache=True)
+    def score_all_guesses(guess_counts, guess_first, guess_last, guess_lens,
+                          rem_counts, rem_first, rem_last, alpha, best_len):
+        """
+        JIT-compiled scoring kernel: for every guess word, return the maximum
+        number of possible remaining words after making the guess.
+
+        Operates purely on the numpy representation from build_word_arrays.
+        Two remaining words end up in the same group exactly when the guess
+        produces identical feedback for both, so instead of applying the up
+        to len(word) + 2 rules one by one, each remaining word gets a single
+        integer "feedback signature" computed in one pass: min(remaining
+        count, guess count) for each letter of the guess, plus the start and
+        end letter matches. The answer is the largest signature bucket,
+        taken via a histogram. Guesses are scored in parallel.
+
+        alpha is a branch-and-bound bound: once a guess's largest bucket
+        exceeds it, the guess cannot beat the best score seen so far, so
+        scoring it is abandoned. A guess longer than best_len (the length of
+        the word achieving alpha) has already lost the length tie-break, so
+        it is abandoned one step earlier, as soon as it merely reaches
+        alpha. Abandoned guesses report a lower bound on their true score
+        that can never win the final argmin.
+        """
+        num_guesses = guess_counts.shape[0]
+        num_remaining = rem_counts.shape[0]
+        max_groups = np.empty(num_guesses, dtype=np.int64)
+        for g in numba.prange(num_guesses):
+            # min(remaining, guess) per letter has guess_count + 1 possible
+            # values, and the start/end matches contribute a factor of 4, so
+            # signatures fit in 4 * prod(guess_count + 1) buckets.
+            num_sigs = np.int64(4)
+            for letter in range(26):
+                if guess_counts[g, letter] > 0:
+                    num_sigs *= guess_counts[g, letter] + 1
+            histogram = np.zeros(num_sigs, dtype=np.int64)
+            max_group = np.int64(0)
+            bound = alpha - 1 if guess_lens[g] > best_len else alpha
+            for r in range(num_remaining):
+                sig = np.int64(0)
+                for letter in range(26):
+                    guess_count = guess_counts[g, letter]
+                    if guess_count > 0:
+                        rem_count = rem_counts[r, letter]
+                        matched = rem_count if rem_count < guess_count else guess_count
+                        sig = sig * (guess_count + 1) + matched
+                start_bit = 1 if rem_first[r] == guess_first[g] else 0
+                end_bit = 1 if rem_last[r] == guess_last[g] else 0
+                bucket = sig * 4 + start_bit * 2 + end_bit
+                histogram[bucket] += 1
+                if histogram[bucket] > max_group:
+                    max_group = histogram[bucket]
+                    if max_group > bound:
+                        break
+            max_groups[g] = max_group
+        return max_groups
+
+def get_next_guess(guess_words: list, guess_idx: np.ndarray, guess_arrays: tuple,
+                   remaining_words: list, rem_arrays: tuple) -> tuple[Word, tuple[int, int]]:
+    """
+    Select the next guess word from the given candidate guesses.
 
     Parameters:
-    all_words -- list of all allowed Word objects.
+    guess_words -- list of candidate guess Word objects.
+    guess_idx -- index array mapping guess matrix rows to guess_words, so a
+    subset of a fixed matrix (e.g. the not-yet-guessed rows of the allowed
+    word matrix) can be scored without rebuilding the Word list.
+    guess_arrays -- numpy representation (see build_word_arrays) of the
+    guess matrix rows selected by guess_idx.
     remaining_words -- list of remaining candidate Word objects.
+    rem_arrays -- numpy representation of the remaining words.
 
-    Return the next guess as a tuple of (Word, compute_score(Word)).
+    Return the next guess as a tuple of (Word, (max_remaining, word length)).
 
     Raise ValueError if there are no remaining words.
     """
@@ -200,31 +539,85 @@ def get_next_guess(all_words: list, remaining_words: list) -> tuple[Word, tuple[
         else:
             return (remaining_words[1], (1, len(remaining_words[1].word)))
 
-    # Batch words into a single task to minimize overhead of creating too many executor tasks.
-    BATCH_SIZE = 1000
-    batches = [all_words[i:i+BATCH_SIZE] for i in range(0, len(all_words), BATCH_SIZE)]
-    results = []
-    with ProcessPoolExecutor() as executor:
-        for batch_result in executor.map(compute_scores_batch, ((batch, remaining_words) for batch in batches)):
-            results.extend(batch_result)
-    return min(results, key=lambda x: x[1])
+    rem_counts, rem_first, rem_last, rem_lens = rem_arrays
+    guess_counts, guess_first, guess_last, guess_lens = guess_arrays
+
+    if numba is not None:
+        num_guesses = guess_counts.shape[0]
+        # Score guesses with many distinct letters first: they tend to
+        # partition finely, driving alpha down early so that later, weaker
+        # guesses are abandoned after only a few remaining words.
+        order = np.argsort(-(guess_counts > 0).sum(axis=1), kind="stable")
+        max_groups = np.empty(num_guesses, dtype=np.int64)
+        alpha = np.int64(len(remaining_words))
+        best_len = np.int64(16)  # longer than any allowed word
+        CHUNK_SIZE = 4096
+        for i in range(0, num_guesses, CHUNK_SIZE):
+            chunk = order[i:i + CHUNK_SIZE]
+            chunk_lens = guess_lens[chunk]
+            chunk_groups = score_all_guesses(
+                guess_counts[chunk], guess_first[chunk], guess_last[chunk], chunk_lens,
+                rem_counts, rem_first, rem_last, alpha, best_len)
+            max_groups[chunk] = chunk_groups
+            chunk_alpha = chunk_groups.min()
+            if chunk_alpha < alpha:
+                alpha = chunk_alpha
+                best_len = np.int64(chunk_lens[chunk_groups == alpha].min())
+            elif chunk_alpha == alpha:
+                best_len = min(best_len, np.int64(chunk_lens[chunk_groups == alpha].min()))
+        # Lexicographic (max_remaining, word length) argmin: word lengths are
+        # at most 10, so they fit in the low 4 bits.
+        combined = max_groups * 16 + guess_lens
+        best = int(np.argmin(combined))
+        best_word = guess_words[int(guess_idx[best])]
+        return (best_word, (int(max_groups[best]), len(best_word.word)))
+
+    # Share the matrices once per call so tasks only carry guess indices
+    # instead of pickling thousands of words per batch.
+    rem_shm, rem_meta = _share_arrays((rem_counts, rem_first, rem_last))
+    guess_shm, guess_meta = _share_arrays((guess_counts, guess_first, guess_last, guess_lens))
+    attach_args = (rem_shm.name, rem_meta, guess_shm.name, guess_meta)
+    num_guesses = guess_counts.shape[0]
+    scores_max = np.empty(num_guesses, dtype=np.int32)
+    try:
+        executor = _get_pool()
+        for start, batch_scores in executor.map(
+                functools.partial(compute_scores_batch, attach_args),
+                range(0, num_guesses, SCORE_BATCH_SIZE)):
+            scores_max[start:start + batch_scores.size] = batch_scores
+    finally:
+        rem_shm.close()
+        rem_shm.unlink()
+        guess_shm.close()
+        guess_shm.unlink()
+    # Lexicographic (max_remaining, word length) argmin, as in the numba path.
+    combined = scores_max.astype(np.int64) * 16 + guess_lens
+    best = int(np.argmin(combined))
+    return (guess_words[int(guess_idx[best])], (int(scores_max[best]), int(guess_lens[best])))
+
+# Matches one letter element of the guess result HTML, capturing its class
+# attribute and the single-letter text content.
+_LETTER_DIV_RE = re.compile(r'class="([^"]*)"[^>]*>\s*([a-zA-Z])\s*<')
 
 def parse_guess_results(html: str) -> list:
     """
     Parse the HTML of the guess result (div with "guess" class) from the
     Diffle UI.
 
+    The structure is trivial (<div class="letter ...">x</div> per letter),
+    so a precompiled regex scan is enough; no need for a full HTML parser.
+
     Return a list of Rules to filter the remaining words by.
     """
-    soup = BeautifulSoup(html, 'html.parser')
     rules = []
     occurrence_count = collections.Counter()
     regex_parts = []
     found_end = False
 
-    for letter_div in soup.find_all(class_="letter"):
-        letter = letter_div.get_text()
-        classes = set(letter_div.get("class", []))
+    for class_attr, letter in _LETTER_DIV_RE.findall(html):
+        classes = frozenset(class_attr.split())
+        if "letter" not in classes:
+            continue
 
         if "absent" in classes:
             # Check equal to 0 as well so we explicitly set a 0 count for the letter, which will allow us to create a
@@ -265,19 +658,67 @@ def parse_guess_results(html: str) -> list:
     return rules
 
 
-def filter_words(words: list, rules: list) -> list:
-    """Return a list of words that satisfy all the given rules."""
-    return [word for word in words if all(rule.matches(word) for rule in rules)]
+def swap_remove(words: list, arrays: tuple, index: dict, word_str: str) -> tuple:
+    """
+    Remove a word from an aligned (words, arrays, index) triple in O(1) by
+    swapping the last entry into its slot, instead of an O(N) list scan plus
+    row deletions. No-op if the word is not present.
+
+    The list and index are updated in place; return the updated arrays.
+    """
+    i = index.pop(word_str, None)
+    if i is None:
+        return arrays
+    last_word = words.pop()
+    if i != len(words):
+        words[i] = last_word
+        index[last_word.word] = i
+    trimmed = []
+    for array in arrays:
+        if not array.flags.writeable:
+            array = array.copy()
+        array[i] = array[-1]
+        trimmed.append(array[:-1])
+    return tuple(trimmed)
+
+def filter_words(words: list, arrays: tuple, rules: list) -> tuple:
+    """
+    Return (words, arrays) filtered down to the words satisfying all the
+    given rules.
+
+    Each rule is evaluated as one vectorized mask over the whole set (see
+    Rule.as_mask) and the masks are ANDed together, instead of calling
+    rule.matches once per word per rule.
+    """
+    counts, first, last, lens = arrays
+    mask = np.ones(len(words), dtype=bool)
+    for rule in rules:
+        mask &= rule.as_mask(counts, first, last, words)
+    idx = np.flatnonzero(mask)
+    filtered_words = [words[i] for i in idx]
+    filtered_arrays = (counts[idx], first[idx], last[idx], lens[idx])
+    return filtered_words, filtered_arrays
 
 # -------------------------
 # Main Interactive Loop
 # -------------------------
 if __name__ == "__main__":
-    allowed_words = clean_words(load_words('allowed.csv'))
-    answer_words = load_words('answers.csv')  # Answers are guaranteed valid so no cleaning needed
-
-    all_words = init_words(allowed_words)
-    remaining_words = init_words(answer_words)
+    all_words = init_words(load_allowed_words())
+    remaining_words = init_words(load_answer_words())
+
+    # The allowed-word matrices are loaded once (memory-mapped from the
+    # build_cache.py cache when present); guessed words are masked out of
+    # `alive` instead of being removed from the list, so each turn only
+    # needs a cheap numpy slice rather than rebuilding anything.
+    all_arrays = load_word_arrays('allowed.npy', all_words)
+    word_to_idx = {word.word: i for i, word in enumerate(all_words)}
+    alive = np.ones(len(all_words), dtype=bool)
+
+    # The remaining-word matrices and string-to-index dict are kept aligned
+    # with remaining_words and sliced down on each filter instead of being
+    # rebuilt per turn.
+    rem_arrays = load_word_arrays('answers.npy', remaining_words)
+    rem_index = {word.word: i for i, word in enumerate(remaining_words)}
 
     # The first guess word is always the same, and is precomputed by calling
     # `get_next_guess` with the full set of `all_words` and `remaining_words`.
@@ -285,29 +726,32 @@ if __name__ == "__main__":
 
     while True:
         print(f"Recommended guess: {guess_word}")
-        try:
-          remaining_words.remove(guess_word)
-        except:
-            pass
-        try:
-          all_words.remove(guess_word)
-        except:
-            pass
+        guessed_idx = word_to_idx.get(guess_word.word)
+        if guessed_idx is not None:
+            alive[guessed_idx] = False
+        rem_arrays = swap_remove(remaining_words, rem_arrays, rem_index, guess_word.word)
 
         guess_html = input("What was the result? Enter the HTML of the div with class 'guess': ")
         rules = parse_guess_results(guess_html)
 
         remaining_words_before_count = len(remaining_words)
-        remaining_words = filter_words(remaining_words, rules)
+        remaining_words, rem_arrays = filter_words(remaining_words, rem_arrays, rules)
+        rem_index = {word.word: i for i, word in enumerate(remaining_words)}
         print(f"Remaining words filtered from {remaining_words_before_count} to {len(remaining_words)}")
         if len(remaining_words) < 20:
             print(remaining_words)
 
+        alive_idx = np.flatnonzero(alive)
+        alive_arrays = tuple(array[alive_idx] for array in all_arrays)
+
         # Prioritize picking a word from `remaining_words`` if it can achieve
         # the same or better results than a word from `all_words` since it
         # gives us a better chance of guessing the exact word.
-        remaining_word_guess, remaining_word_score = get_next_guess(remaining_words, remaining_words)
-        all_words_guess, all_words_score = get_next_guess(all_words, remaining_words)
+        remaining_word_guess, remaining_word_score = get_next_guess(
+            remaining_words, np.arange(len(remaining_words)), rem_arrays,
+            remaining_words, rem_arrays)
+        all_words_guess, all_words_score = get_next_guess(
+            all_words, alive_idx, alive_arrays, remaining_words, rem_arrays)
         guess_word = all_words_guess if all_words_score < remaining_word_score else remaining_word_guess
 
         print(f"[debug] remaining_word_guess: {remaining_word_guess}, score: {remaining_word_score}")